@@ -1,10 +1,19 @@
 # python 3.13.9, pygame 2.6.1, pygame-ce 2.5.6, SDL 2.32.10, customtkinter 5.2.2, mutagen 1.47.0
+import time
+STARTUP_BEGIN = time.perf_counter() # measured before the GUI imports below
+
+import sys
+if "--headless" in sys.argv: # hand over before any GUI toolkit is imported
+    from MusicPlayer_headless import main
+    sys.exit(main())
+
 import threading
 import customtkinter as ctk
 import pygame
-from tkinter import filedialog, Listbox, END, SINGLE
+from tkinter import filedialog, messagebox, Listbox, END, SINGLE
 from pathlib import Path
 from mutagen import File
+from playlist_io import PLAYLIST_FILETYPES, build_library_index, import_playlist, export_playlist, format_missing_report
 
 # Initialize Pygame mixer & display module
 pygame.mixer.init()
@@ -40,6 +49,7 @@ class MusicPlayer(ctk.CTk):
 
         # State variables
         self.music_files = []
+        self.library_index = {} # tracks of the last folder scan, used to resolve playlist entries
         self.current_index = -1
         self.is_paused = False
         self.song_length = 0
@@ -103,28 +113,34 @@ class MusicPlayer(ctk.CTk):
         # Control panel
         self.controls_frame = ctk.CTkFrame(self.main_container, corner_radius=15)
         self.controls_frame.grid(row=2, column=0, padx=10, pady=(0, 10), sticky="ew")
-        self.controls_frame.grid_columnconfigure(1, weight=1)
-        self.controls_frame.grid_columnconfigure(6, weight=1)
+        self.controls_frame.grid_columnconfigure(3, weight=1)
+        self.controls_frame.grid_columnconfigure(8, weight=1)
 
         btn_style = {"corner_radius": 40, "height": 40, "font": ("Segoe UI", 14, "bold")}
 
         self.btn_open = ctk.CTkButton(self.controls_frame, text="Open music folder", command=self.start_folder_scan, **btn_style)
         self.btn_open.grid(row=0, column=0, padx=10, pady=10)
 
+        self.btn_load = ctk.CTkButton(self.controls_frame, text="Open playlist", command=self.start_playlist_import, **btn_style)
+        self.btn_load.grid(row=0, column=1, padx=(0, 10), pady=10)
+
+        self.btn_save = ctk.CTkButton(self.controls_frame, text="Save playlist", command=self.start_playlist_export, **btn_style)
+        self.btn_save.grid(row=0, column=2, padx=(0, 10), pady=10)
+
         self.btn_prev = ctk.CTkButton(self.controls_frame, text="PREV", width=100, command=self.prev_track, **btn_style)
-        self.btn_prev.grid(row=0, column=2, padx=5, pady=10)
+        self.btn_prev.grid(row=0, column=4, padx=5, pady=10)
 
         self.btn_play = ctk.CTkButton(self.controls_frame, text="PLAY/PAUSE", command=self.toggle_play, **btn_style)
-        self.btn_play.grid(row=0, column=3, padx=5, pady=10)
+        self.btn_play.grid(row=0, column=5, padx=5, pady=10)
 
         self.btn_stop = ctk.CTkButton(self.controls_frame, text="STOP", width=100, command=self.stop_music, **btn_style)
-        self.btn_stop.grid(row=0, column=4, padx=5, pady=10)
+        self.btn_stop.grid(row=0, column=6, padx=5, pady=10)
 
         self.btn_next = ctk.CTkButton(self.controls_frame, text="NEXT", width=100, command=self.next_track, **btn_style)
-        self.btn_next.grid(row=0, column=5, padx=5, pady=10)
+        self.btn_next.grid(row=0, column=7, padx=5, pady=10)
 
         self.status_label = ctk.CTkLabel(self.controls_frame, text="0 tracks loaded", font=("Segoe UI", 14))
-        self.status_label.grid(row=0, column=7, padx=10, pady=10, sticky="e")
+        self.status_label.grid(row=0, column=9, padx=10, pady=10, sticky="e")
 
         # Start background monitor for playback and auto-next
         self.monitor_playback()
@@ -183,6 +199,8 @@ class MusicPlayer(ctk.CTk):
         folder_path = filedialog.askdirectory()
         if folder_path:
             self.btn_open.configure(state="disabled", text="Scanning...")
+            self.btn_load.configure(state="disabled") # scan and playlist import share music_files
+            self.btn_save.configure(state="disabled") # no saving a half-built playlist
             self.music_files = []
             self.playlist.delete(0, END)
             threading.Thread(target=self.scan_logic, args=(folder_path,), daemon=True).start()
@@ -201,12 +219,13 @@ class MusicPlayer(ctk.CTk):
 
         # sort using the second element (display name) of the tuple
         temp_data.sort(key=self.get_display_name_lower)
-        self.after(0, self.finalize_scan, temp_data)
+        self.after(0, self.finalize_scan, temp_data, build_library_index(temp_data))
 
     def get_display_name_lower(self, item):
         return item[1].lower()
 
-    def finalize_scan(self, found_data):
+    def finalize_scan(self, found_data, library_index):
+        self.library_index = library_index
         for full_path, display_name in found_data:
             self.music_files.append(full_path)
             self.playlist.insert(END, display_name)
@@ -214,8 +233,63 @@ class MusicPlayer(ctk.CTk):
             self.current_index = 0
             self.playlist.selection_set(0)
         self.btn_open.configure(state="normal", text="Open music folder")
+        self.btn_load.configure(state="normal")
+        self.btn_save.configure(state="normal")
         self.status_label.configure(text=f"{len(self.music_files)} tracks loaded")
 
+    def start_playlist_import(self): # launches threaded streaming playlist reader
+        playlist_path = filedialog.askopenfilename(filetypes=PLAYLIST_FILETYPES)
+        if playlist_path:
+            self.btn_load.configure(state="disabled", text="Loading...")
+            self.btn_open.configure(state="disabled") # scan and playlist import share music_files
+            self.btn_save.configure(state="disabled") # no saving a half-built playlist
+            self.music_files = []
+            self.playlist.delete(0, END)
+            threading.Thread(target=self.import_logic, args=(playlist_path,), daemon=True).start()
+
+    def import_logic(self, playlist_path):
+        missing, error = [], ""
+        try:
+            for music_files, display_names, batch_missing in import_playlist(playlist_path, self.library_index):
+                self.after(0, self.add_playlist_batch, music_files, display_names)
+                missing.extend(batch_missing)
+        except Exception as e: # any failure must still reach finalize_import to re-enable the buttons
+            error = str(e)
+        finally:
+            self.after(0, self.finalize_import, missing, error)
+
+    def add_playlist_batch(self, music_files, display_names):
+        if display_names:
+            self.music_files.extend(music_files)
+            self.playlist.insert(END, *display_names) # one widget call per batch
+            self.status_label.configure(text=f"{len(self.music_files)} tracks loaded")
+
+    def finalize_import(self, missing, error):
+        if self.music_files:
+            self.current_index = 0
+            self.playlist.selection_set(0)
+        self.btn_load.configure(state="normal", text="Open playlist")
+        self.btn_open.configure(state="normal")
+        self.btn_save.configure(state="normal")
+        status = f"{len(self.music_files)} tracks loaded"
+        if missing:
+            status += f", {len(missing)} missing"
+        self.status_label.configure(text=status)
+        if error:
+            messagebox.showerror("Open playlist", error)
+        if missing:
+            messagebox.showwarning("Open playlist", format_missing_report(missing))
+
+    def start_playlist_export(self):
+        if not self.music_files: return
+        playlist_path = filedialog.asksaveasfilename(defaultextension=".m3u8", filetypes=PLAYLIST_FILETYPES)
+        if playlist_path:
+            try:
+                count = export_playlist(playlist_path, self.music_files, self.playlist.get(0, END))
+                self.status_label.configure(text=f"{count} tracks saved")
+            except OSError as e:
+                messagebox.showerror("Save playlist", str(e))
+
     def format_time(self, seconds):
         mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
@@ -301,4 +375,11 @@ class MusicPlayer(ctk.CTk):
 
 if __name__ == "__main__":
     app = MusicPlayer()
-    app.mainloop()
+    if "--measure" in sys.argv: # compare with: python MusicPlayer.py --headless --measure
+        app.update()
+        startup_seconds = time.perf_counter() - STARTUP_BEGIN
+        from startup_stats import startup_stats # no other imports, so the RSS figure is not skewed
+        print(startup_stats(startup_seconds))
+        app.destroy()
+    else:
+        app.mainloop()
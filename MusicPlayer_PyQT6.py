@@ -2,12 +2,13 @@ import threading
 import pygame
 from pathlib import Path
 from mutagen import File
+from playlist_io import PLAYLIST_NAME_FILTER, build_library_index, import_playlist, export_playlist, format_missing_report
 
 # ADD PYQT6 IMPORTS
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QSlider, QListWidget, QFrame,
-    QInputDialog, QFileDialog
+    QInputDialog, QFileDialog, QMessageBox
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal # Import pyqtSignal
 from PyQt6.QtGui import QFont, QKeyEvent # Import QKeyEvent
@@ -17,7 +18,10 @@ pygame.mixer.init()
 
 class MusicPlayer(QMainWindow):
     # Define a custom signal to communicate scan completion from worker thread to GUI thread
-    scan_completed_signal = pyqtSignal(list)
+    scan_completed_signal = pyqtSignal(list, dict)
+    # Signals carrying streamed playlist batches and the final missing-entry list from the import thread
+    playlist_batch_signal = pyqtSignal(list, list)
+    import_completed_signal = pyqtSignal(list, str)
 
     def __init__(self):
         super().__init__()
@@ -29,6 +33,7 @@ class MusicPlayer(QMainWindow):
 
         # State variables
         self.music_files = []
+        self.library_index = {} # tracks of the last folder scan, used to resolve playlist entries
         self.current_index = -1
         self.is_paused = False
         self.song_length = 0
@@ -63,6 +68,7 @@ class MusicPlayer(QMainWindow):
         # Apply stylesheet to reduce item spacing
         self.playlist.setStyleSheet("QListWidget::item { padding: 0px; margin: 0px; min-height: 15px; }")
         self.playlist.setSpacing(0) # Also set spacing between items to 0
+        self.playlist.setUniformItemSizes(True) # skips per-item size calculation for very large playlists
         self.list_layout.addWidget(self.playlist)
 
         # QListWidget has built-in scrollbars, so explicit QScrollbar is often not needed.
@@ -106,31 +112,40 @@ class MusicPlayer(QMainWindow):
         self.btn_open = create_button("Open music folder", self.start_folder_scan)
         self.controls_layout.addWidget(self.btn_open, 0, 0, 1, 1) # span 1 column
 
+        self.btn_load = create_button("Open playlist", self.start_playlist_import)
+        self.controls_layout.addWidget(self.btn_load, 0, 1)
+
+        self.btn_save = create_button("Save playlist", self.start_playlist_export)
+        self.controls_layout.addWidget(self.btn_save, 0, 2)
+
         self.btn_prev = create_button("PREV", self.prev_track)
         self.btn_prev.setFixedWidth(100)
-        self.controls_layout.addWidget(self.btn_prev, 0, 2)
+        self.controls_layout.addWidget(self.btn_prev, 0, 4)
 
         self.btn_play = create_button("PLAY/PAUSE", self.toggle_play)
-        self.controls_layout.addWidget(self.btn_play, 0, 3)
+        self.controls_layout.addWidget(self.btn_play, 0, 5)
 
         self.btn_stop = create_button("STOP", self.stop_music)
         self.btn_stop.setFixedWidth(100)
-        self.controls_layout.addWidget(self.btn_stop, 0, 4)
+        self.controls_layout.addWidget(self.btn_stop, 0, 6)
 
         self.btn_next = create_button("NEXT", self.next_track)
         self.btn_next.setFixedWidth(100)
-        self.controls_layout.addWidget(self.btn_next, 0, 5)
+        self.controls_layout.addWidget(self.btn_next, 0, 7)
 
         self.status_label = QLabel("0 tracks loaded")
         self.status_label.setFont(QFont("Segoe UI", 12))
-        self.controls_layout.addWidget(self.status_label, 0, 6, 1, 2, Qt.AlignmentFlag.AlignRight)
+        self.controls_layout.addWidget(self.status_label, 0, 8, 1, 2, Qt.AlignmentFlag.AlignRight)
 
         # Adjust column weights in QGridLayout
-        self.controls_layout.setColumnStretch(1, 1)
-        self.controls_layout.setColumnStretch(6, 1)
+        self.controls_layout.setColumnStretch(3, 1)
+        self.controls_layout.setColumnStretch(8, 1)
 
         # Connect the custom signal to the finalize_scan method
         self.scan_completed_signal.connect(self.finalize_scan)
+        # Connect the playlist import signals
+        self.playlist_batch_signal.connect(self.add_playlist_batch)
+        self.import_completed_signal.connect(self.finalize_import)
 
         # start background monitor for playback and auto-next using QTimer
         self.playback_timer = QTimer(self)
@@ -208,6 +223,8 @@ class MusicPlayer(QMainWindow):
         if folder_path:
             self.btn_open.setEnabled(False)
             self.btn_open.setText("Scanning...")
+            self.btn_load.setEnabled(False) # scan and playlist import share music_files
+            self.btn_save.setEnabled(False) # no saving a half-built playlist
             self.music_files = []
             self.playlist.clear()
             threading.Thread(target=self.scan_logic, args=(folder_path,), daemon=True).start()
@@ -225,9 +242,10 @@ class MusicPlayer(QMainWindow):
                     temp_data.append((str(path), path.name))
 
         temp_data.sort(key=lambda x: x[1].lower())
-        self.scan_completed_signal.emit(temp_data)
+        self.scan_completed_signal.emit(temp_data, build_library_index(temp_data))
 
-    def finalize_scan(self, found_data):
+    def finalize_scan(self, found_data, library_index):
+        self.library_index = library_index
         for full_path, display_name in found_data:
             self.music_files.append(full_path)
             self.playlist.addItem(display_name)
@@ -236,8 +254,66 @@ class MusicPlayer(QMainWindow):
             self.playlist.setCurrentRow(0)
         self.btn_open.setEnabled(True)
         self.btn_open.setText("Open music folder")
+        self.btn_load.setEnabled(True)
+        self.btn_save.setEnabled(True)
         self.status_label.setText(f"{len(self.music_files)} tracks loaded")
 
+    def start_playlist_import(self):
+        playlist_path, _ = QFileDialog.getOpenFileName(self, "Open Playlist", "", PLAYLIST_NAME_FILTER)
+        if playlist_path:
+            self.btn_load.setEnabled(False)
+            self.btn_load.setText("Loading...")
+            self.btn_open.setEnabled(False) # scan and playlist import share music_files
+            self.btn_save.setEnabled(False) # no saving a half-built playlist
+            self.music_files = []
+            self.playlist.clear()
+            threading.Thread(target=self.import_logic, args=(playlist_path,), daemon=True).start()
+
+    def import_logic(self, playlist_path):
+        missing, error = [], ""
+        try:
+            for music_files, display_names, batch_missing in import_playlist(playlist_path, self.library_index):
+                self.playlist_batch_signal.emit(music_files, display_names)
+                missing.extend(batch_missing)
+        except Exception as e: # any failure must still reach finalize_import to re-enable the buttons
+            error = str(e)
+        finally:
+            self.import_completed_signal.emit(missing, error)
+
+    def add_playlist_batch(self, music_files, display_names):
+        if display_names:
+            self.music_files.extend(music_files)
+            self.playlist.addItems(display_names) # one widget call per batch
+            self.status_label.setText(f"{len(self.music_files)} tracks loaded")
+
+    def finalize_import(self, missing, error):
+        if self.music_files:
+            self.current_index = 0
+            self.playlist.setCurrentRow(0)
+        self.btn_load.setEnabled(True)
+        self.btn_load.setText("Open playlist")
+        self.btn_open.setEnabled(True)
+        self.btn_save.setEnabled(True)
+        status = f"{len(self.music_files)} tracks loaded"
+        if missing:
+            status += f", {len(missing)} missing"
+        self.status_label.setText(status)
+        if error:
+            QMessageBox.critical(self, "Open Playlist", error)
+        if missing:
+            QMessageBox.warning(self, "Open Playlist", format_missing_report(missing))
+
+    def start_playlist_export(self):
+        if not self.music_files: return
+        playlist_path, _ = QFileDialog.getSaveFileName(self, "Save Playlist", "playlist.m3u8", PLAYLIST_NAME_FILTER)
+        if playlist_path:
+            try:
+                display_names = [self.playlist.item(i).text() for i in range(self.playlist.count())]
+                count = export_playlist(playlist_path, self.music_files, display_names)
+                self.status_label.setText(f"{count} tracks saved")
+            except OSError as e:
+                QMessageBox.critical(self, "Save Playlist", str(e))
+
     def format_time(self, seconds):
         mins, secs = divmod(int(seconds), 60)
         return f"{mins:02d}:{secs:02d}"
@@ -0,0 +1,395 @@
+# python 3.13.9, pygame 2.6.1, pygame-ce 2.5.6, SDL 2.32.10, mutagen 1.47.0
+# Headless MusicPlayer: never imports tkinter, customtkinter or PyQt6
+import time
+STARTUP_BEGIN = time.perf_counter() # measured before the heavy imports below
+
+import sys
+import queue
+import socket
+import argparse
+import threading
+import pygame
+from pathlib import Path
+from mutagen import File
+from playlist_io import build_library_index, import_playlist, export_playlist, format_missing_report
+from startup_stats import startup_stats
+
+# Initialize Pygame mixer only (no display module needed without a window)
+pygame.mixer.init()
+
+HELP_TEXT = """commands:
+  open <folder>   scan a music folder (recursive)
+  load <file>     open an M3U/M3U8/PLS playlist (entries resolved against the scanned folder)
+  save <file>     save the playlist as M3U/M3U8/PLS
+  list            show the playlist
+  search <text>   select the first track or folder matching text (F3)
+  find            select the next match of the last search (F4)
+  play [n]        play track n, or the selected track
+  pause           toggle play/pause (space)
+  stop            stop playback
+  next / prev     next or previous track (Down / Up)
+  seek <seconds>  jump to an absolute position in the current track
+  status          show the current track and position
+  stats           show startup time and resident memory
+  quit            exit the player"""
+
+def stderr_reply(text):
+    print(text, file=sys.stderr, flush=True)
+
+class MusicPlayer:
+    def __init__(self):
+        # State variables (same as the GUI classes)
+        self.music_files = []
+        self.library_index = {} # tracks of the last folder scan, used to resolve playlist entries
+        self.current_index = -1
+        self.is_paused = False
+        self.song_length = 0
+        self.is_playing = False
+        self.seek_offset = 0 # tracks absolute position in the current track
+        self.is_scanning = False
+
+        # Playlist state (display names and selection replace the Listbox widget)
+        self.playlist = []
+        self.selected_index = -1
+
+        # Search state variables
+        self.last_query = ""
+        self.last_search_index = -1
+
+        # Work for the main loop; stdin, socket and scan threads only enqueue here
+        self.tasks = queue.Queue()
+        self.last_reply = stderr_reply # errors outside a command go to whoever sent the last one
+        self.running = True
+        self.startup_seconds = 0
+
+    def after(self, func, *args): # run func on the main loop thread
+        self.tasks.put((func, args))
+
+    def mainloop(self):
+        self.startup_seconds = time.perf_counter() - STARTUP_BEGIN
+        while self.running:
+            try:
+                func, args = self.tasks.get(timeout=0.1)
+                func(*args)
+            except queue.Empty:
+                pass
+            except Exception as e: # a bad command must not end playback on a daemon
+                self.last_reply(f"Error: {e}")
+            try:
+                self.monitor_playback()
+            except Exception as e:
+                self.last_reply(f"Playback error: {e}")
+
+    def monitor_playback(self): # auto-next when the current track has finished
+        if self.is_playing and not self.is_paused and not pygame.mixer.music.get_busy():
+            self.next_track()
+
+    def handle_command(self, line, reply):
+        self.last_reply = reply
+        command, _, argument = line.strip().partition(" ")
+        command, argument = command.lower(), argument.strip()
+        try:
+            if not command:
+                return
+            elif command == "open":
+                self.start_folder_scan(argument, reply)
+            elif command == "load":
+                self.start_playlist_import(argument, reply)
+            elif command == "save":
+                self.start_playlist_export(argument, reply)
+            elif command == "list":
+                for idx, display_name in enumerate(self.playlist):
+                    marker = "*" if idx == self.current_index else " "
+                    reply(f"{marker}{idx:5d}  {display_name}")
+                reply(f"{len(self.music_files)} tracks loaded")
+            elif command == "search":
+                self.trigger_search(argument, reply)
+            elif command == "find":
+                self.find_next_search(reply)
+            elif command == "play":
+                index = int(argument) if argument else None
+                if index is not None and not 0 <= index < len(self.music_files):
+                    reply(f"no track {index}, {len(self.music_files)} tracks loaded")
+                    return
+                self.play_track(index=index)
+                self.report_status(reply)
+            elif command == "pause":
+                self.toggle_play()
+                self.report_status(reply)
+            elif command == "stop":
+                self.stop_music()
+                self.report_status(reply)
+            elif command == "next":
+                self.next_track()
+                self.report_status(reply)
+            elif command == "prev":
+                self.prev_track()
+                self.report_status(reply)
+            elif command == "seek":
+                self.seek(float(argument))
+                self.report_status(reply)
+            elif command == "status":
+                self.report_status(reply)
+            elif command == "stats":
+                reply(startup_stats(self.startup_seconds))
+            elif command == "help":
+                reply(HELP_TEXT)
+            elif command == "quit":
+                self.stop_music()
+                self.running = False
+                reply("bye")
+            else:
+                reply(f"unknown command: {command} (try 'help')")
+        except ValueError:
+            reply(f"invalid argument for {command}: {argument}")
+
+    def report_status(self, reply):
+        if not self.is_playing:
+            reply(f"stopped, {len(self.music_files)} tracks loaded")
+            return
+        state = "paused" if self.is_paused else "playing"
+        position = self.get_position()
+        reply(f"{state} [{self.current_index}] {self.playlist[self.current_index]} "
+              f"{self.format_time(position)}/{self.format_time(self.song_length)}")
+
+    def get_position(self):
+        relative_pos = max(0, pygame.mixer.music.get_pos() / 1000)
+        return relative_pos + self.seek_offset
+
+    def seek(self, value): # same as slider_event in the GUI classes
+        if self.is_playing:
+            value = min(max(0, value), self.song_length)
+            self.seek_offset = value
+            pygame.mixer.music.play(start=value)
+            if self.is_paused:
+                pygame.mixer.music.pause()
+
+    def trigger_search(self, query, reply): # F3 search functionality
+        if query:
+            self.last_query = query.lower()
+            self.last_search_index = -1
+            self.find_next_search(reply)
+
+    def find_next_search(self, reply): # F4 cyclic search functionality
+        if not self.last_query: return
+        num_tracks = len(self.playlist)
+        start_index = self.last_search_index + 1
+        for i in range(num_tracks):
+            idx = (start_index + i) % num_tracks
+            if self.last_query in self.playlist[idx].lower():
+                self.last_search_index = idx
+                self.selected_index = idx
+                reply(f"selected [{idx}] {self.playlist[idx]}")
+                return
+        reply(f"no match for: {self.last_query}")
+
+    def start_folder_scan(self, folder_path, reply): # launches threaded recursive scanner
+        if self.is_scanning:
+            reply("scan already in progress")
+        elif not folder_path:
+            reply("usage: open <folder>")
+        elif not Path(folder_path).is_dir():
+            reply(f"not a folder: {folder_path}")
+        else:
+            self.is_scanning = True
+            self.stop_music() # the playing track's index is about to become invalid
+            self.current_index = -1
+            self.music_files = []
+            self.playlist = []
+            reply("Scanning...")
+            threading.Thread(target=self.scan_logic, args=(folder_path, reply), daemon=True).start()
+
+    def scan_logic(self, folder_path, reply):
+        extensions = ('.mp3', '.wav', '.flac')
+        temp_data = []
+        base_path = Path(folder_path)
+        for path in base_path.rglob('*'):
+            if path.suffix.lower() in extensions:
+                try:
+                    display_name = str(path.relative_to(base_path))
+                    temp_data.append((str(path), display_name))
+                except Exception:
+                    temp_data.append((str(path), path.name))
+
+        # sort using the second element (display name) of the tuple
+        temp_data.sort(key=self.get_display_name_lower)
+        self.after(self.finalize_scan, temp_data, build_library_index(temp_data), reply)
+
+    def get_display_name_lower(self, item):
+        return item[1].lower()
+
+    def finalize_scan(self, found_data, library_index, reply):
+        self.library_index = library_index
+        for full_path, display_name in found_data:
+            self.music_files.append(full_path)
+            self.playlist.append(display_name)
+        if self.music_files:
+            self.current_index = 0
+            self.selected_index = 0
+        self.is_scanning = False
+        reply(f"{len(self.music_files)} tracks loaded")
+
+    def start_playlist_import(self, playlist_path, reply): # launches threaded streaming playlist reader
+        if self.is_scanning:
+            reply("scan already in progress")
+        elif not playlist_path:
+            reply("usage: load <file>")
+        elif not Path(playlist_path).is_file():
+            reply(f"not a file: {playlist_path}")
+        else:
+            self.is_scanning = True
+            self.stop_music() # the playing track's index is about to become invalid
+            self.current_index = -1
+            self.music_files = []
+            self.playlist = []
+            reply("Loading...")
+            threading.Thread(target=self.import_logic, args=(playlist_path, reply), daemon=True).start()
+
+    def import_logic(self, playlist_path, reply):
+        missing = []
+        try:
+            for music_files, display_names, batch_missing in import_playlist(playlist_path, self.library_index):
+                self.after(self.add_playlist_batch, music_files, display_names)
+                missing.extend(batch_missing)
+        except Exception as e: # any failure must still reach finalize_import to clear is_scanning
+            reply(f"Playlist error: {e}")
+        finally:
+            self.after(self.finalize_import, missing, reply)
+
+    def add_playlist_batch(self, music_files, display_names):
+        self.music_files.extend(music_files)
+        self.playlist.extend(display_names)
+
+    def finalize_import(self, missing, reply):
+        if self.music_files:
+            self.current_index = 0
+            self.selected_index = 0
+        self.is_scanning = False
+        if missing:
+            reply(format_missing_report(missing))
+        reply(f"{len(self.music_files)} tracks loaded, {len(missing)} missing")
+
+    def start_playlist_export(self, playlist_path, reply):
+        if self.is_scanning:
+            reply("scan in progress, try again when it has finished")
+            return
+        if not playlist_path:
+            reply("usage: save <file>")
+            return
+        try:
+            count = export_playlist(playlist_path, self.music_files, self.playlist)
+            reply(f"{count} tracks saved")
+        except OSError as e:
+            reply(f"Playlist error: {e}")
+
+    def format_time(self, seconds):
+        mins, secs = divmod(int(seconds), 60)
+        return f"{mins:02d}:{secs:02d}"
+
+    def play_track(self, index=None):
+        try:
+            if index is None:
+                index = self.selected_index
+            if not 0 <= index < len(self.music_files):
+                return # exit if nothing valid is selected and no index provided
+            self.current_index = index
+
+            track_path = self.music_files[self.current_index]
+            audio = File(track_path)
+            self.song_length = audio.info.length
+
+            # Reset seek variables for new track
+            self.seek_offset = 0
+
+            pygame.mixer.music.load(track_path)
+            pygame.mixer.music.play()
+            self.is_playing, self.is_paused = True, False
+            self.selected_index = self.current_index
+
+        except Exception as e:
+            pygame.mixer.music.stop()
+            self.is_playing, self.is_paused = False, False # keeps monitor_playback from skipping on
+            self.last_reply(f"Playback error: {e}")
+
+    def toggle_play(self):
+        if not self.music_files: return
+        if self.is_playing and not self.is_paused:
+            pygame.mixer.music.pause()
+            self.is_paused = True
+        elif self.is_paused:
+            pygame.mixer.music.unpause()
+            self.is_paused = False
+        else:
+            self.play_track()
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+        self.is_playing, self.is_paused = False, False
+        self.seek_offset = 0
+
+    def next_track(self):
+        if self.music_files:
+            new_idx = (self.current_index + 1) % len(self.music_files)
+            self.play_track(index=new_idx)
+
+    def prev_track(self):
+        if self.music_files:
+            new_idx = (self.current_index - 1) % len(self.music_files)
+            self.play_track(index=new_idx)
+
+def stdin_reply(text):
+    print(text, flush=True)
+
+def read_stdin(player): # feeds stdin lines to the main loop
+    for line in sys.stdin:
+        player.after(player.handle_command, line, stdin_reply)
+    player.after(player.handle_command, "quit", stdin_reply) # EOF quits, like closing the window
+
+def serve_client(player, conn):
+    with conn, conn.makefile("r", encoding="utf-8") as reader:
+        def reply(text):
+            try:
+                conn.sendall((text + "\n").encode("utf-8"))
+            except OSError:
+                pass # client went away; playback carries on
+        for line in reader:
+            player.after(player.handle_command, line, reply)
+
+def serve_socket(player, server): # local control socket, one thread per client
+    while True:
+        conn, _ = server.accept()
+        threading.Thread(target=serve_client, args=(player, conn), daemon=True).start()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MusicPlayer without a GUI, controlled from stdin or a local socket.")
+    parser.add_argument("--headless", action="store_true", help="accepted for symmetry with the GUI scripts")
+    parser.add_argument("--socket", type=int, metavar="PORT", help="also accept commands on 127.0.0.1:PORT")
+    parser.add_argument("--no-stdin", action="store_true", help="ignore stdin (daemon use, requires --socket)")
+    parser.add_argument("--measure", action="store_true", help="print startup time and resident memory, then exit")
+    parser.add_argument("folder", nargs="?", help="music folder to scan at startup")
+    args = parser.parse_args(argv)
+
+    if args.no_stdin and args.socket is None:
+        parser.error("--no-stdin requires --socket")
+
+    player = MusicPlayer()
+    if args.measure:
+        print(startup_stats(time.perf_counter() - STARTUP_BEGIN))
+        return 0
+
+    if args.folder:
+        player.after(player.handle_command, f"open {args.folder}", stdin_reply)
+    if args.socket is not None:
+        server = socket.create_server(("127.0.0.1", args.socket)) # bind errors surface before playback starts
+        threading.Thread(target=serve_socket, args=(player, server), daemon=True).start()
+    if not args.no_stdin:
+        threading.Thread(target=read_stdin, args=(player,), daemon=True).start()
+
+    try:
+        player.mainloop()
+    except KeyboardInterrupt:
+        player.stop_music()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
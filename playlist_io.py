@@ -0,0 +1,92 @@
+# Streaming M3U/M3U8/PLS playlist import and export, shared by all MusicPlayer front ends
+import os
+from urllib.parse import urlparse, unquote
+
+PLAYLIST_FILETYPES = [("Playlists", "*.m3u *.m3u8 *.pls"), ("All files", "*.*")]
+PLAYLIST_NAME_FILTER = ";;".join(f"{name} ({pattern})" for name, pattern in PLAYLIST_FILETYPES) # Qt file dialog form
+CHUNK_SIZE = 1 << 20 # bytes of playlist text read (and written) per chunk
+MISSING_REPORT_LIMIT = 20
+
+def library_key(path): # string-only normalisation, no filesystem access
+    return os.path.normcase(os.path.abspath(path))
+
+def build_library_index(found_data): # maps library_key -> (full_path, display_name)
+    return {library_key(full_path): (full_path, display_name) for full_path, display_name in found_data}
+
+def is_pls(playlist_path):
+    return playlist_path.lower().endswith('.pls')
+
+def read_entry_chunks(playlist_path): # yields lists of raw entries, CHUNK_SIZE bytes at a time
+    # PLS entries are taken in file order and the N in FileN= is not used: export_playlist and
+    # most other writers number entries in file order, and honouring N would mean reading the whole file
+    pls = is_pls(playlist_path)
+    with open(playlist_path, "r", encoding="utf-8-sig", errors="replace") as f:
+        while True:
+            lines = f.readlines(CHUNK_SIZE)
+            if not lines:
+                break
+            entries = []
+            for line in lines:
+                line = line.strip()
+                if pls:
+                    key, sep, value = line.partition("=")
+                    if sep and key[:4].lower() == "file":
+                        entries.append(value.strip())
+                elif line and not line.startswith("#"):
+                    entries.append(line)
+            yield entries
+
+def entry_to_path(entry, base_dir):
+    if entry.lower().startswith("file://"):
+        path = unquote(urlparse(entry).path)
+        if os.name == "nt" and path[:1] == "/" and path[2:3] == ":": # file:///C:/...
+            path = path[1:]
+        return path
+    if "://" in entry: # streams and other URLs cannot be in the library
+        return None
+    return os.path.join(base_dir, entry)
+
+def import_playlist(playlist_path, library_index):
+    # Yields (music_files, display_names, missing) batches, one per chunk of the playlist file.
+    # Entries are resolved by dictionary lookup in library_index instead of stat calls,
+    # so anything not found in the scanned library counts as missing.
+    base_dir = os.path.dirname(os.path.abspath(playlist_path))
+    for entries in read_entry_chunks(playlist_path):
+        music_files, display_names, missing = [], [], []
+        for entry in entries:
+            path = entry_to_path(entry, base_dir)
+            track = library_index.get(library_key(path)) if path is not None else None
+            if track is None:
+                missing.append(entry)
+            else:
+                music_files.append(track[0])
+                display_names.append(track[1])
+        yield music_files, display_names, missing
+
+def export_playlist(playlist_path, music_files, display_names):
+    # M3U/M3U8 and PLS are written in chunks, PLS puts NumberOfEntries at the end like Winamp
+    pls = is_pls(playlist_path)
+    with open(playlist_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write("[playlist]\n" if pls else "#EXTM3U\n")
+        chunk, chunk_len, count = [], 0, 0
+        for count, (full_path, display_name) in enumerate(zip(music_files, display_names), start=1):
+            if pls:
+                text = f"File{count}={full_path}\nTitle{count}={display_name}\n"
+            else:
+                text = f"#EXTINF:-1,{display_name}\n{full_path}\n"
+            chunk.append(text)
+            chunk_len += len(text)
+            if chunk_len >= CHUNK_SIZE:
+                f.write("".join(chunk))
+                chunk, chunk_len = [], 0
+        f.write("".join(chunk))
+        if pls:
+            f.write(f"NumberOfEntries={count}\nVersion=2\n")
+    return count
+
+def format_missing_report(missing, limit=MISSING_REPORT_LIMIT):
+    lines = [f"{len(missing)} playlist entries were not found in the music library:"]
+    lines.extend(missing[:limit])
+    if len(missing) > limit:
+        lines.append(f"... and {len(missing) - limit} more")
+    return "\n".join(lines)
@@ -0,0 +1,21 @@
+# Startup time and resident memory report shared by the GUI and headless builds
+# Kept free of other imports so it does not skew the numbers it reports
+import sys
+
+try:
+    import resource # not available on Windows
+except ImportError:
+    resource = None
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin": # macOS reports bytes, Linux reports kilobytes
+        usage //= 1024
+    return usage
+
+def startup_stats(startup_seconds):
+    rss = peak_rss_kb()
+    rss_text = f"{rss / 1024:.1f} MB" if rss is not None else "n/a"
+    return f"startup {startup_seconds * 1000:.0f} ms, peak RSS {rss_text}"
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy") # no sound card needed
+pytest.importorskip("pygame")
+
+from MusicPlayer_headless import MusicPlayer
+
+def make_player(tmp_path, names=()):
+    player = MusicPlayer()
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"not audio") # mutagen cannot read these, so playback fails
+        player.music_files.append(str(path))
+        player.playlist.append(name)
+    return player
+
+def test_play_rejects_out_of_range_index(tmp_path):
+    player = make_player(tmp_path, ["a.wav", "b.wav"])
+    replies = []
+
+    player.handle_command("play -1", replies.append)
+    player.handle_command("play 999", replies.append)
+
+    assert replies == ["no track -1, 2 tracks loaded", "no track 999, 2 tracks loaded"]
+    assert player.current_index == -1
+    assert not player.is_playing
+
+def test_mainloop_survives_failing_task(tmp_path):
+    player = make_player(tmp_path)
+    replies = []
+    player.last_reply = replies.append
+
+    player.after(player.report_status, None) # raises TypeError inside the loop
+    player.after(player.handle_command, "quit", replies.append)
+    player.mainloop()
+
+    assert replies[0].startswith("Error: ")
+    assert replies[-1] == "bye"
+
+def test_broken_track_stops_instead_of_skipping(tmp_path):
+    player = make_player(tmp_path, ["a.wav", "b.wav"])
+    replies = []
+
+    player.handle_command("play 0", replies.append)
+    for _ in range(5):
+        player.monitor_playback()
+
+    assert replies[0].startswith("Playback error: ")
+    assert replies[1:] == ["stopped, 2 tracks loaded"]
+    assert not player.is_playing
+
+def test_open_without_folder_does_not_scan(tmp_path):
+    player = make_player(tmp_path, ["a.wav"])
+    replies = []
+
+    player.handle_command("open", replies.append)
+
+    assert replies == ["usage: open <folder>"]
+    assert not player.is_scanning
+    assert player.playlist == ["a.wav"]
+
+def run_pending(player): # drains work queued by scan/import threads
+    while player.is_scanning or not player.tasks.empty():
+        func, args = player.tasks.get(timeout=5)
+        func(*args)
+
+def test_load_rejects_non_file_without_stopping(tmp_path):
+    player = make_player(tmp_path, ["a.wav"])
+    replies = []
+
+    player.handle_command(f"load {tmp_path}", replies.append)
+
+    assert replies == [f"not a file: {tmp_path}"]
+    assert player.playlist == ["a.wav"]
+    assert not player.is_scanning
+
+def test_failed_import_clears_busy_state(tmp_path, monkeypatch):
+    player = make_player(tmp_path)
+    playlist_path = tmp_path / "list.m3u"
+    playlist_path.write_text("a.wav\n", encoding="utf-8")
+    def broken_import(playlist_path, library_index):
+        raise ValueError("bad playlist")
+        yield
+    monkeypatch.setattr("MusicPlayer_headless.import_playlist", broken_import)
+    replies = []
+
+    player.handle_command(f"load {playlist_path}", replies.append)
+    run_pending(player)
+
+    assert "Playlist error: bad playlist" in replies
+    assert not player.is_scanning
+
+def test_save_refused_while_scanning(tmp_path):
+    player = make_player(tmp_path, ["a.wav"])
+    player.is_scanning = True
+    replies = []
+
+    player.handle_command(f"save {tmp_path / 'out.m3u8'}", replies.append)
+
+    assert replies == ["scan in progress, try again when it has finished"]
+    assert not (tmp_path / "out.m3u8").exists()
@@ -0,0 +1,91 @@
+from pathlib import Path
+
+import playlist_io
+from playlist_io import build_library_index, import_playlist, export_playlist, format_missing_report
+
+def make_library(tmp_path, names):
+    found_data = [(str(tmp_path / "music" / name), name) for name in names]
+    return found_data, build_library_index(found_data)
+
+def read_all(playlist_path, library_index):
+    music_files, display_names, missing = [], [], []
+    for batch_files, batch_names, batch_missing in import_playlist(str(playlist_path), library_index):
+        music_files.extend(batch_files)
+        display_names.extend(batch_names)
+        missing.extend(batch_missing)
+    return music_files, display_names, missing
+
+def test_m3u_round_trip(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["b.mp3", "a/c.flac", "d.wav"])
+    playlist_path = tmp_path / "out.m3u8"
+    files = [full_path for full_path, _ in found_data]
+    names = [display_name for _, display_name in found_data]
+
+    assert export_playlist(str(playlist_path), files, names) == 3
+    assert read_all(playlist_path, library_index) == (files, names, [])
+
+def test_pls_round_trip(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["b.mp3", "a/c.flac", "d.wav"])
+    playlist_path = tmp_path / "out.pls"
+    files = [full_path for full_path, _ in found_data]
+    names = [display_name for _, display_name in found_data]
+
+    assert export_playlist(str(playlist_path), files, names) == 3
+    assert playlist_path.read_text(encoding="utf-8").endswith("NumberOfEntries=3\nVersion=2\n")
+    assert read_all(playlist_path, library_index) == (files, names, [])
+
+def test_pls_entries_keep_file_order(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["one.mp3", "two.mp3", "three.mp3"])
+    playlist_path = tmp_path / "music" / "list.pls"
+    playlist_path.parent.mkdir()
+    playlist_path.write_text("[playlist]\nFile3=three.mp3\nTitle3=Three\nFile\u00b2=one.mp3\nFile2=two.mp3\n"
+                             "NumberOfEntries=3\n", encoding="utf-8")
+
+    assert read_all(playlist_path, library_index)[1] == ["three.mp3", "one.mp3", "two.mp3"]
+
+def test_relative_entries_resolve_against_playlist_folder(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["a/c.flac", "d.wav"])
+    playlist_path = tmp_path / "music" / "a" / "list.m3u"
+    playlist_path.parent.mkdir(parents=True)
+    playlist_path.write_text("#EXTM3U\n#EXTINF:-1,C\nc.flac\n\n../d.wav\n", encoding="utf-8")
+
+    music_files, display_names, missing = read_all(playlist_path, library_index)
+    assert display_names == ["a/c.flac", "d.wav"]
+    assert missing == []
+
+def test_file_urls_resolve(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["my song.mp3"])
+    playlist_path = tmp_path / "list.m3u"
+    playlist_path.write_text(Path(found_data[0][0]).as_uri() + "\n", encoding="utf-8")
+
+    assert read_all(playlist_path, library_index)[0] == [found_data[0][0]]
+
+def test_urls_and_unknown_files_are_missing(tmp_path):
+    found_data, library_index = make_library(tmp_path, ["d.wav"])
+    playlist_path = tmp_path / "music" / "list.m3u"
+    playlist_path.parent.mkdir()
+    playlist_path.write_text("http://radio.example/stream\nd.wav\nnot-there.mp3\n", encoding="utf-8")
+
+    music_files, display_names, missing = read_all(playlist_path, library_index)
+    assert display_names == ["d.wav"]
+    assert missing == ["http://radio.example/stream", "not-there.mp3"]
+
+def test_import_streams_in_chunks(tmp_path, monkeypatch):
+    names = [f"t{i}.mp3" for i in range(1000)]
+    found_data, library_index = make_library(tmp_path, names)
+    playlist_path = tmp_path / "out.m3u"
+    export_playlist(str(playlist_path), [full_path for full_path, _ in found_data], names)
+    monkeypatch.setattr(playlist_io, "CHUNK_SIZE", 4096)
+
+    batches = list(import_playlist(str(playlist_path), library_index))
+    assert len(batches) > 1
+    assert [name for _, batch_names, _ in batches for name in batch_names] == names
+
+def test_missing_report_is_truncated():
+    missing = [f"gone{i}.mp3" for i in range(25)]
+    report = format_missing_report(missing, limit=20).split("\n")
+
+    assert report[0] == "25 playlist entries were not found in the music library:"
+    assert report[1:21] == missing[:20]
+    assert report[-1] == "... and 5 more"
+    assert len(format_missing_report(missing[:3]).split("\n")) == 4